@@ -1,7 +1,8 @@
-from .agent import prompt
+from .agent import prompt, close_llm
 from . import models
 
 __all__ = [
     "prompt",
+    "close_llm",
     "models"
 ]
\ No newline at end of file
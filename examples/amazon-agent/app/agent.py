@@ -1,11 +1,12 @@
-import json
+import functools
 import logging
 import os
 import traceback
-from typing import AsyncGenerator
+from typing import AsyncGenerator, NamedTuple
 
 import httpx
 import openai
+import orjson
 from browser_use.browser.context import BrowserContext
 
 from .config import AMAZON_URL
@@ -63,28 +64,67 @@ async def execute_openai_compatible_toolcall(
         return
     yield f"Unknown tool call: {name}; Available tools are: {list(shopping_browsing_tool_function_map.keys()) + list(purchase_management_tool_function_map.keys())}"
 
+# Helper to clean environment variables (strip quotes and handle empty values)
+def clean_env_var(var, default):
+    val = os.getenv(var)
+    if val:
+        return val.strip('"\'') or default
+    return default
+
+class LLMSettings(NamedTuple):
+    base_url: str
+    api_key: str
+    model_id: str
+
+# Resolved on first use rather than at import: server.py loads .env only after
+# importing this package.
+@functools.lru_cache(maxsize=1)
+def get_llm_settings() -> LLMSettings:
+    return LLMSettings(
+        base_url=clean_env_var("LLM_BASE_URL", "http://localmodel:65534/v1"),
+        api_key=clean_env_var("LLM_API_KEY", "no-need"),
+        model_id=clean_env_var("LLM_MODEL_ID", 'local-llm'),
+    )
+
+_llm: openai.AsyncClient | None = None
+
+def get_llm() -> openai.AsyncClient:
+    global _llm
+
+    if _llm is None:
+        settings = get_llm_settings()
+        _llm = openai.AsyncClient(
+            base_url=settings.base_url,
+            api_key=settings.api_key,
+            max_retries=3,
+            http_client=openai.DefaultAsyncHttpxClient(
+                http2=True,
+                timeout=httpx.Timeout(600.0, connect=5.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        )
+
+    return _llm
+
+async def close_llm() -> None:
+    global _llm
+
+    if _llm is not None:
+        await _llm.close()
+        _llm = None
+
 async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext, **_) -> AsyncGenerator[str, None]:
     page = await browser_context.get_current_page()
     current_url = page.url
     
+    # the shared context normally stays on Amazon between requests (the server
+    # opens it at startup), so this only navigates after the user wandered off
     if not current_url.startswith(AMAZON_URL):
-        await page.goto(AMAZON_URL)
-        await page.wait_for_load_state('load', timeout=10000)
+        await page.goto(AMAZON_URL, wait_until='domcontentloaded')
 
     functions = get_functions()
-
-    # Helper to clean environment variables (strip quotes and handle empty values)
-    def clean_env_var(var, default):
-        val = os.getenv(var)
-        if val:
-            return val.strip('"\'') or default
-        return default
-
-    llm = openai.AsyncClient(
-        base_url=clean_env_var("LLM_BASE_URL", "http://localmodel:65534/v1"),
-        api_key=clean_env_var("LLM_API_KEY", "no-need"),
-        max_retries=3
-    )
+    llm = get_llm()
+    model_id = get_llm_settings().model_id
 
     messages = await refine_chat_history(messages, get_system_prompt())
     
@@ -96,7 +136,7 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
 
     try:
         completion = await llm.chat.completions.create(
-            model=clean_env_var("LLM_MODEL_ID", 'local-llm'),
+            model=model_id,
             messages=messages,
             tools=functions,
             tool_choice="auto",
@@ -111,11 +151,14 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
 
         while completion.choices[0].message.tool_calls is not None and len(completion.choices[0].message.tool_calls) > 0:
             calls += len(completion.choices[0].message.tool_calls)
-            executed = set([])
-            
+            executed: set[tuple[str, bytes]] = set()
+
+            # calls are run one at a time on purpose: every tool drives the current
+            # page of the single shared browser context, so overlapping them would
+            # race on navigation
             for call in completion.choices[0].message.tool_calls:
                 _id, _name = call.id, call.function.name    
-                _args = json.loads(call.function.arguments)
+                _args = orjson.loads(call.function.arguments)
                 agent_type = get_agent_for_tool(_name)
                 result, has_exception = '', False
 
@@ -127,7 +170,9 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
                         messages.append({"role": "system", "content": "You are a shopping browsing agent. You are responsible for browsing the product and adding them to the cart."})
                 previous_agent = agent_type
 
-                identity = _name + call.function.arguments
+                # key on the parsed arguments so formatting/key-order differences
+                # in the model's JSON do not defeat the duplicate check
+                identity = (_name, orjson.dumps(_args, option=orjson.OPT_SORT_KEYS))
                 
                 logger.info(f"messages: {messages}")
                 logger.info(f"previous_agent: {previous_agent}")
@@ -143,13 +188,15 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
                 else:
                     executed.add(identity)
 
-                    yield await to_chunk_data(wrap_toolcall_request(
+                    yield to_chunk_data(wrap_toolcall_request(
                         uuid=response_uuid,
                         fn_name=_name,
                         args=_args
                     )
                     )
 
+                    _parts: list[str] = []
+
                     try:
                         async for msg in execute_openai_compatible_toolcall(
                             ctx=browser_context, 
@@ -157,7 +204,7 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
                             args=_args,
                             agent_type=agent_type
                         ):
-                            yield await to_chunk_data(
+                            yield to_chunk_data(
                                 wrap_toolcall_response(
                                     uuid=response_uuid,
                                     fn_name=_name,
@@ -167,13 +214,15 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
                             )
                            
                             if isinstance(msg, str):
-                                result += msg + '\n'
+                                _parts.append(msg)
+
+                        result = ''.join(f'{part}\n' for part in _parts)
 
                     except Exception as e:
                         logger.error(f"{e}", exc_info=True)
                         result = f"Something went wrong, {e}. After then, Re-execute {_name} with these arguments: {_args}" 
 
-                        yield await to_chunk_data(
+                        yield to_chunk_data(
                             wrap_toolcall_response(
                                 uuid=response_uuid,
                                 fn_name=_name,
@@ -187,7 +236,7 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
                     {
                         "role": "tool",
                         "tool_call_id": _id,
-                        "content": json.dumps(refine_mcp_response(result))
+                        "content": orjson.dumps(refine_mcp_response(result)).decode()
                     }
                 )
 
@@ -198,7 +247,7 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
 
             completion = await llm.chat.completions.create(
                 messages=messages,
-                model=clean_env_var("LLM_MODEL_ID", 'local-llm'),
+                model=model_id,
                 tools=functions if need_toolcalls else openai._types.NOT_GIVEN,  # type: ignore
                 tool_choice="auto" if need_toolcalls else openai._types.NOT_GIVEN,  # type: ignore
                 seed=42,
@@ -235,7 +284,7 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
             logger.error(f"Error occurred: {error_message}")
             logger.error(f"Error details: {error_details}")
 
-            yield await to_chunk_data(
+            yield to_chunk_data(
                 oai_compatible_models.PromptErrorResponse(
                     message=error_message, 
                     details=error_details
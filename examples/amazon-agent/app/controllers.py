@@ -32,24 +32,23 @@ built_in_actions = [
     'update_range_contents' 
 ]
 
-exclude = [
-    a
-    for a in built_in_actions
-    if a not in [
-        'done',
-        'go_to_url',
-        'go_back',
-        'click_element_by_index',
-        'input_text',
-        'extract_content',
-        'scroll_down',
-        'scroll_up',
-        'send_keys',
-        'get_dropdown_options',
-        'select_dropdown_option',
-        'update_range_contents' 
-    ]
-]
+allowed_actions = frozenset({
+    'done',
+    'go_to_url',
+    'go_back',
+    'click_element_by_index',
+    'input_text',
+    'extract_content',
+    'scroll_down',
+    'scroll_up',
+    'send_keys',
+    'get_dropdown_options',
+    'select_dropdown_option',
+    'update_range_contents'
+})
+
+# filtered (rather than plain set difference) to keep built_in_actions order
+exclude = [a for a in built_in_actions if a not in allowed_actions]
 
 _controller = Controller(
     exclude_actions=exclude
@@ -8,6 +8,84 @@ import urllib.parse
 
 logger = logging.getLogger()
 
+_CART_URL = f"{AMAZON_URL}/cart"
+_CART_URL_NORMALIZED = normalize_url(_CART_URL)
+
+_SEARCH_RESULTS_JS = """(limit) => {
+    const text = (root, sel) => root.querySelector(sel)?.textContent?.trim() || null;
+    const results = document.querySelectorAll('[role="listitem"].s-result-item');
+    const items = [...results].slice(0, limit).map(r => ({
+        name: text(r, 'h2 span'),
+        price: text(r, '.a-price .a-offscreen'),
+        rating: text(r, '.a-icon-alt'),
+        reviews: text(r, 'a[href*="#customerReviews"] span')?.replace(/[()]/g, '') || null,
+        prime: !!r.querySelector('.a-icon-prime'),
+        href: r.querySelector('a.a-link-normal.s-no-outline, h2 a.a-link-normal, a.a-link-normal.s-line-clamp-2')?.getAttribute('href') || null,
+    }));
+    return {total: results.length, items};
+}"""
+
+_PRODUCT_DETAIL_JS = """() => {
+    const text = (root, sel) => root.querySelector(sel)?.textContent?.trim() || null;
+    let price = null;
+    for (const sel of ['#priceblock_ourprice', '#priceblock_dealprice', '.a-price .a-offscreen']) {
+        price = text(document, sel);
+        if (price) break;
+    }
+    const d = document.querySelector('span[data-csa-c-delivery-type="Delivery"]');
+    return {
+        title: text(document, '#productTitle, h1'),
+        price,
+        rating: text(document, '.a-icon-star span.a-icon-alt'),
+        reviews: text(document, '#acrCustomerReviewText'),
+        features: [...document.querySelectorAll('#feature-bullets ul li span')]
+            .map(el => el.textContent.trim()).filter(Boolean),
+        description: text(document, '#productDescription_feature_div p'),
+        delivery: d ? {
+            time: d.getAttribute('data-csa-c-delivery-time') || text(d, 'span.a-text-bold'),
+            cutoff: d.getAttribute('data-csa-c-delivery-cutoff') || text(d, '#ftCountdown'),
+            price: d.getAttribute('data-csa-c-delivery-price'),
+        } : null,
+    };
+}"""
+
+_CART_ITEMS_JS = """() => {
+    const text = (root, sel) => root.querySelector(sel)?.textContent?.trim() || null;
+    return [...document.querySelectorAll('#activeCartViewForm .sc-list-item')].map(item => {
+        const spin = item.querySelector('div[role="spinbutton"]');
+        const remove = item.querySelector('input[name^="submit.delete-active."]');
+        return {
+            title: text(item, '.sc-product-title'),
+            price: text(item, '.a-price.apex-price-to-pay-value .a-offscreen'),
+            quantity: spin ? spin.getAttribute('aria-valuenow') : text(item, 'span[data-a-selector="value"]'),
+            remove_name: remove ? (remove.getAttribute('name') || '') : null,
+            increment: !!item.querySelector('button[data-action="a-stepper-increment"]'),
+            decrement: !!item.querySelector('button[data-action="a-stepper-decrement"]'),
+            quantity_box: !!item.querySelector('input[name="quantityBox"]'),
+        };
+    });
+}"""
+
+_ORDER_CARDS_JS = """() => {
+    const text = (root, sel) => root.querySelector(sel)?.textContent?.trim() || null;
+    return [...document.querySelectorAll('li.order-card__list')].map(order => ({
+        order_id: text(order, 'div.yohtmlc-order-id span:last-child'),
+        titles: [...order.querySelectorAll('.a-unordered-list li .yohtmlc-product-title')]
+            .map(el => el.textContent.trim()).filter(Boolean),
+        date: text(order, '.order-header span.a-size-base.a-color-secondary.aok-break-word'),
+    }));
+}"""
+
+_ADD_TO_CART_PROBE_JS = """(selectors) => selectors.map(sel => {
+    const el = document.querySelector(sel);
+    if (!el) return null;
+    return {
+        disabled: el.hasAttribute('disabled'),
+        style: el.getAttribute('style') || '',
+        hover: el.getAttribute('data-hover') || '',
+    };
+})"""
+
 async def sign_in(ctx: BrowserContext, **args):
     page = await ctx.get_current_page()
     current_url = page.url
@@ -83,11 +161,14 @@ async def search_products(ctx: BrowserContext, **args):
             })
             return
 
-    search_results = await page.query_selector_all('[role="listitem"].s-result-item')
-    logger.info(f"Search results count: {len(search_results)}")
+    # one round-trip for every field of every result instead of ~8 CDP calls
+    # per result
+    search_results = await page.evaluate(_SEARCH_RESULTS_JS, 10)
+    items = search_results['items']
+    logger.info(f"Search results count: {search_results['total']}")
 
     products = []
-    if len(search_results) == 0:
+    if len(items) == 0:
         gen_id = IncrementID()
 
         task = 'Strictly follow the instructions below:\n'
@@ -109,70 +190,47 @@ async def search_products(ctx: BrowserContext, **args):
         yield json.dumps({"status": "success", "products": products}, ensure_ascii=False, indent=2)
     
     
-    for idx, result in enumerate(search_results[:10]):
-        # Name
-        name = None
-        name_el = await result.query_selector('h2 span')
-        if name_el:
-            name = (await name_el.text_content()).strip()
-
-        # Price
-        price = None
-        price_el = await result.query_selector('.a-price .a-offscreen')
-        if price_el:
-            price = (await price_el.text_content()).strip()
+    for idx, item in enumerate(items):
+        name = item['name']
+        price = item['price']
+        reviews = item['reviews']
+        prime = item['prime']
 
         # Rating
         rating = None
-        rating_el = await result.query_selector('.a-icon-alt')
-        if rating_el:
-            rating_text = (await rating_el.text_content()).strip()
+        if item['rating']:
             try:
-                rating = float(rating_text.split(' out of')[0])
+                rating = float(item['rating'].split(' out of')[0])
             except Exception:
                 rating = None
 
-        # Reviews
-        reviews = None
-        reviews_el = await result.query_selector('a[href*="#customerReviews"] span')
-        if reviews_el:
-            reviews = (await reviews_el.text_content()).strip().replace('(', '').replace(')', '')
-
-        # Prime
-        prime = False
-        prime_el = await result.query_selector('.a-icon-prime')
-        if prime_el:
-            prime = True
-
         # Link
         link = None
-        link_el = await result.query_selector('a.a-link-normal.s-no-outline, h2 a.a-link-normal, a.a-link-normal.s-line-clamp-2')
-        if link_el:
-            href = await link_el.get_attribute('href')
-            if href:
-                # Handle affiliate links
-                if href.startswith('/sspa/click'):
-                    parsed = urllib.parse.urlparse(href)
-                    qs = urllib.parse.parse_qs(parsed.query)
-                    url_param = qs.get('url', [None])[0]
-                    if url_param:
-                        real_url = urllib.parse.unquote(url_param)
-                        # Remove query string and fragment from real_url
-                        real_url = urllib.parse.urlunparse(urllib.parse.urlparse(real_url)._replace(query='', fragment=''))
-                        # If the real_url is a relative path, prepend AMAZON_URL
-                        if real_url.startswith('/'):
-                            # If the URL is relative (starts with /), prepend the origin
-                            link = f"{origin}{real_url}"
-                        else:
-                            # If the URL is absolute, still combine with origin to ensure consistent domain
-                            parsed_real_url = urllib.parse.urlparse(real_url)
-                            link = f"{origin}{parsed_real_url.path}"
-                            if parsed_real_url.query:
-                                link += f"?{parsed_real_url.query}"
+        href = item['href']
+        if href:
+            # Handle affiliate links
+            if href.startswith('/sspa/click'):
+                parsed = urllib.parse.urlparse(href)
+                qs = urllib.parse.parse_qs(parsed.query)
+                url_param = qs.get('url', [None])[0]
+                if url_param:
+                    real_url = urllib.parse.unquote(url_param)
+                    # Remove query string and fragment from real_url
+                    real_url = urllib.parse.urlunparse(urllib.parse.urlparse(real_url)._replace(query='', fragment=''))
+                    # If the real_url is a relative path, prepend AMAZON_URL
+                    if real_url.startswith('/'):
+                        # If the URL is relative (starts with /), prepend the origin
+                        link = f"{origin}{real_url}"
                     else:
-                        link = f"{origin}{href.split('?')[0]}"
+                        # If the URL is absolute, still combine with origin to ensure consistent domain
+                        parsed_real_url = urllib.parse.urlparse(real_url)
+                        link = f"{origin}{parsed_real_url.path}"
+                        if parsed_real_url.query:
+                            link += f"?{parsed_real_url.query}"
                 else:
                     link = f"{origin}{href.split('?')[0]}"
+            else:
+                link = f"{origin}{href.split('?')[0]}"
 
         # Only add if name and link exist
         if name and link:
@@ -213,99 +271,33 @@ async def get_product_detail(ctx: BrowserContext, **args):
             yield json.dumps({"error": "Failed to load product detail page or selector not found."})
             return
 
-    # Title
-    title = None
-    title_el = await page.query_selector('#productTitle, h1')
-    if title_el:
-        title = (await title_el.text_content()).strip()
-
-    # Price
-    price = None
-    price_selectors = ['#priceblock_ourprice', '#priceblock_dealprice', '.a-price .a-offscreen']
-    for sel in price_selectors:
-        price_el = await page.query_selector(sel)
-        if price_el:
-            price = (await price_el.text_content()).strip()
-            if price:
-                break
+    # every field in one round-trip rather than ~10 sequential query_selector calls
+    detail = await page.evaluate(_PRODUCT_DETAIL_JS)
 
-    # Rating
     rating = None
-    rating_el = await page.query_selector('.a-icon-star span.a-icon-alt')
-    if rating_el:
-        rating_text = (await rating_el.text_content()).strip()
+    if detail['rating']:
         try:
-            rating = float(rating_text.split(' out of')[0])
+            rating = float(detail['rating'].split(' out of')[0])
         except Exception:
-            rating = rating_text
-
-    # Number of reviews
-    reviews = None
-    reviews_el = await page.query_selector('#acrCustomerReviewText')
-    if reviews_el:
-        reviews = (await reviews_el.text_content()).strip()
-
-    # Bullet points/features
-    features = []
-    feature_els = await page.query_selector_all('#feature-bullets ul li span')
-    for el in feature_els:
-        text = (await el.text_content()).strip()
-        if text:
-            features.append(text)
-            
-    # Description
-    description = None
-    description_el = await page.query_selector('#productDescription_feature_div p')
-    if description_el:
-        description = (await description_el.text_content()).strip()
-        
-    # Delivery
-    delivery = None
-    delivery_time = None
-    delivery_cutoff = None
-    delivery_price = None
-
-    delivery_el = await page.query_selector('span[data-csa-c-delivery-type="Delivery"]')
-    if delivery_el:
-        # Try to get delivery time from attribute
-        delivery_time = await delivery_el.get_attribute('data-csa-c-delivery-time')
-        delivery_cutoff = await delivery_el.get_attribute('data-csa-c-delivery-cutoff')
-        delivery_price = await delivery_el.get_attribute('data-csa-c-delivery-price')
-        # Fallback: try to get visible text if attribute is missing
-        if not delivery_time:
-            # Try to get the text from the bold span inside
-            bold_time_el = await delivery_el.query_selector('span.a-text-bold')
-            if bold_time_el:
-                delivery_time = (await bold_time_el.text_content()).strip()
-        if not delivery_cutoff:
-            cutoff_el = await delivery_el.query_selector('#ftCountdown')
-            if cutoff_el:
-                delivery_cutoff = (await cutoff_el.text_content()).strip()
-        # Compose delivery string
-        delivery = {
-            "time": delivery_time,
-            "cutoff": delivery_cutoff,
-            "price": delivery_price
-        }
+            rating = detail['rating']
 
     product_detail = {
-        "title": title,
-        "price": price,
+        "title": detail['title'],
+        "price": detail['price'],
         "rating": rating,
-        "reviews": reviews,
-        "features": features,
-        "description": description,
+        "reviews": detail['reviews'],
+        "features": detail['features'],
+        "description": detail['description'],
         "url": link,
-        "delivery": delivery
+        "delivery": detail['delivery']
     }
 
     yield json.dumps({"status": "success", "data": product_detail}, ensure_ascii=False, indent=2)
 
 async def check_out(ctx: BrowserContext, **args):
     page = await ctx.get_current_page()
-    if normalize_url(page.url) != normalize_url(f"{AMAZON_URL}/cart"):
-        await page.goto(f"{AMAZON_URL}/cart")
-        await asyncio.sleep(2)
+    if normalize_url(page.url) != _CART_URL_NORMALIZED:
+        await page.goto(_CART_URL, wait_until='domcontentloaded')
 
     # Click on the "Proceed to checkout" button
     await page.wait_for_selector("input[name='proceedToRetailCheckout']", state='visible')
@@ -313,11 +305,18 @@ async def check_out(ctx: BrowserContext, **args):
     if checkout_button:
         await checkout_button.click()
         logger.info("Checkout button clicked, waiting for the next page to load...")
-        await asyncio.sleep(2)
+        # leaves the cart for either the sign-in or the checkout page
+        try:
+            await page.wait_for_url(lambda url: '/cart' not in url, wait_until='domcontentloaded', timeout=15000)
+        except Exception:
+            logger.warning(f"Still on {page.url} after clicking checkout")
 
         await check_browser_current_state(ctx)
 
-        await asyncio.sleep(3)
+        try:
+            await page.wait_for_url(lambda url: '/checkout' in url, wait_until='domcontentloaded', timeout=15000)
+        except Exception:
+            logger.warning(f"Checkout page not reached, current URL: {page.url}")
 
         # Ensure we are on the checkout page
         logger.info(f"Current page URL after clicking checkout: {page.url}")
@@ -331,7 +330,10 @@ async def check_out(ctx: BrowserContext, **args):
             if prime_sign_up:
                 logger.info("Prime sign up detected, clicking 'No thanks' button.")
                 await prime_sign_up.click()
-                await asyncio.sleep(2)
+                try:
+                    await page.wait_for_selector('a#prime-decline-button', state='hidden', timeout=5000)
+                except Exception:
+                    logger.info("Prime sign up still showing after 'No thanks'")
 
         # check for 
         await review_checkout_card_empty_delivery(ctx)
@@ -351,82 +353,50 @@ async def check_out(ctx: BrowserContext, **args):
     
 async def go_to_cart(ctx: BrowserContext, **args):
     page = await ctx.get_current_page()
-    if normalize_url(page.url) != normalize_url(f"{AMAZON_URL}/cart"):
-        await page.goto(f"{AMAZON_URL}/cart")
+    if normalize_url(page.url) != _CART_URL_NORMALIZED:
+        await page.goto(_CART_URL)
         await page.wait_for_load_state('domcontentloaded')
 
     try:
         await page.query_selector('#activeCartViewForm')
-        cart_items = await page.query_selector_all('#activeCartViewForm .sc-list-item')
+        # one DOM walk in the page instead of 6-8 CDP calls per cart item
+        cart_items = await page.evaluate(_CART_ITEMS_JS)
         cart_contents = []
 
         for item in cart_items:
-            # Title
-            title = None
-            title_el = await item.query_selector('.sc-product-title')
-            if title_el:
-                title = (await title_el.text_content()).strip()
-
-            # Price
-            price = None
-            price_el = await item.query_selector('.a-price.apex-price-to-pay-value')
-            if price_el:
-                price_span = await price_el.query_selector('.a-offscreen')
-                if price_span:
-                    price = (await price_span.text_content()).strip()
-
-            # Quantity
             quantity = 1
-            quantity_el = await item.query_selector('div[role="spinbutton"]')
-            if quantity_el:
+            if item['quantity']:
                 try:
-                    quantity_val = await quantity_el.get_attribute('aria-valuenow')
-                    if quantity_val:
-                        quantity = int(quantity_val)
+                    quantity = int(item['quantity'])
                 except Exception:
                     pass
-            else:
-                quantity_span = await item.query_selector('span[data-a-selector="value"]')
-                if quantity_span:
-                    try:
-                        quantity_val = await quantity_span.text_content()
-                        if quantity_val:
-                            quantity = int(quantity_val)
-                    except Exception:
-                        pass
-
 
             # Remove button selector (input[name^="submit.delete-active."])
-            remove_btn = await item.query_selector('input[name^="submit.delete-active."]')
             remove_button_selector = None
-            if remove_btn:
-                btn_name = await remove_btn.get_attribute('name')
-                if btn_name:
-                    remove_button_selector = f'input[name="{btn_name}"]'
+            if item['remove_name'] is not None:
+                if item['remove_name']:
+                    remove_button_selector = f'input[name="{item["remove_name"]}"]'
                 else:
                     remove_button_selector = 'input[name^="submit.delete-active."]'
 
             # Edit button selector (stepper or quantityBox)
             # Prefer stepper increment/decrement buttons if available, else fallback to quantityBox input
             edit_button_selector = None
-            increment_btn = await item.query_selector('button[data-action="a-stepper-increment"]')
-            decrement_btn = await item.query_selector('button[data-action="a-stepper-decrement"]')
-            quantity_box = await item.query_selector('input[name="quantityBox"]')
-            if increment_btn:
+            if item['increment']:
                 edit_button_selector = 'button[data-action="a-stepper-increment"]'
-            elif decrement_btn:
+            elif item['decrement']:
                 edit_button_selector = 'button[data-action="a-stepper-decrement"]'
-            elif quantity_box:
+            elif item['quantity_box']:
                 edit_button_selector = 'input[name="quantityBox"]'
 
             cart_contents.append({
-                "title": title,
-                "price": price,
+                "title": item['title'],
+                "price": item['price'],
                 "quantity": quantity,
                 "remove_button_selector": remove_button_selector,
                 "edit_button_selector": edit_button_selector,
-                "increment_quantity_selector": 'button[data-action="a-stepper-increment"]' if increment_btn else None,
-                "decrement_quantity_selector": 'button[data-action="a-stepper-decrement"]' if decrement_btn else None
+                "increment_quantity_selector": 'button[data-action="a-stepper-increment"]' if item['increment'] else None,
+                "decrement_quantity_selector": 'button[data-action="a-stepper-decrement"]' if item['decrement'] else None
             })
         logger.info(f"Cart contents: {cart_contents}")
         yield json.dumps({"status": "success", "cart_contents": cart_contents}, ensure_ascii=False, indent=2)
@@ -451,28 +421,27 @@ async def add_to_cart(ctx: BrowserContext, **args):
             '#buy-now-button'
         ]
         
+        # probe every candidate (presence, disabled state, hover text) in one
+        # round-trip, then click the first one that exists
+        probes = await page.evaluate(_ADD_TO_CART_PROBE_JS, selectors)
+
         clicked = False
-        for selector in selectors:
+        for selector, probe in zip(selectors, probes):
+            if probe is None:
+                continue
             try:
-                btn = await page.query_selector(selector)
-                if btn:
-                    # Check if button is disabled
-                    is_disabled = await btn.get_attribute('disabled')
-                    style = await btn.get_attribute('style')
-                    if is_disabled is not None or (style and 'not-allowed' in style):
-                        # Optionally, get data-hover for more context
-                        data_hover = await btn.get_attribute('data-hover')
-                        msg = "The 'Add to Cart' button is disabled."
-                        if data_hover:
-                            msg += f" Amazon says: {data_hover.replace('<br>', ' ').replace('<b>', '').replace('</b>', '').strip()}"
-                        logger.error(msg)
-                        yield json.dumps({"error": msg})
-                        return
-                    await btn.click()
-                    clicked = True
-                    logger.info(f"Successfully clicked 'Add to Cart' button with selector: {selector}")
-                    
-                    break
+                if probe['disabled'] or 'not-allowed' in probe['style']:
+                    msg = "The 'Add to Cart' button is disabled."
+                    if probe['hover']:
+                        msg += f" Amazon says: {probe['hover'].replace('<br>', ' ').replace('<b>', '').replace('</b>', '').strip()}"
+                    logger.error(msg)
+                    yield json.dumps({"error": msg})
+                    return
+                await page.click(selector)
+                clicked = True
+                logger.info(f"Successfully clicked 'Add to Cart' button with selector: {selector}")
+
+                break
             except Exception as e:
                 logger.warning(f"Failed to click button with selector {selector}: {str(e)}")
                 continue
@@ -506,9 +475,7 @@ async def add_to_cart(ctx: BrowserContext, **args):
 async def get_order_history(ctx: BrowserContext, **args):
     page = await ctx.get_current_page()
 
-    await page.goto(f"{AMAZON_URL}/orders")
-
-    await asyncio.sleep(2)
+    await page.goto(f"{AMAZON_URL}/orders", wait_until='domcontentloaded')
 
     if 'amazon.com/ap/signin' in page.url:
         await sign_in(ctx)
@@ -516,22 +483,12 @@ async def get_order_history(ctx: BrowserContext, **args):
     await page.wait_for_selector('li.order-card__list', state='visible')
 
     orders = []
-    order_elements = await page.query_selector_all('li.order-card__list')
+    # one DOM walk in the page instead of three CDP queries per order card
+    order_cards = await page.evaluate(_ORDER_CARDS_JS)
 
-    for order in order_elements:
-        logger.info(f"Processing order element: {order}")
-    
-        order_id_el = await order.query_selector('div.yohtmlc-order-id span:last-child')
-        order_id = (await order_id_el.text_content()).strip() if order_id_el else None
-        order_list_el = await order.query_selector_all('.a-unordered-list li .yohtmlc-product-title')
-
-        # append order titles from the order_list_el
-        order_titles = []
-        for el in order_list_el:
-            title = (await el.text_content()).strip()
-            if title:
-                order_titles.append(title)
-        order_title = ', '.join(order_titles) if order_titles else None
+    for order in order_cards:
+        order_id = order['order_id']
+        order_title = ', '.join(order['titles']) if order['titles'] else None
         logger.info(f"Order ID: {order_id}, Order Title: {order_title}")
         if not order_id:
             logger.warning("Order ID not found, skipping this order.")
@@ -540,14 +497,10 @@ async def get_order_history(ctx: BrowserContext, **args):
         if not order_title:
             logger.warning("Order title not found, skipping this order.")
             continue
-       
-        date_el = await order.query_selector('.order-header span.a-size-base.a-color-secondary.aok-break-word')
-        date = (await date_el.text_content()).strip() if date_el else None
-     
 
         orders.append({
             "order_id": order_id,
-            "date": date,
+            "date": order['date'],
             "title": order_title
         })
 
@@ -561,14 +514,16 @@ async def cancel_order(ctx: BrowserContext, **args):
         yield json.dumps({"error": "order_id is required"})
         return
 
-    await page.goto(f"{AMAZON_URL}/orders")
-
-    await asyncio.sleep(2)
+    await page.goto(f"{AMAZON_URL}/orders", wait_until='domcontentloaded')
 
     if 'amazon.com/ap/signin' in page.url:
         await sign_in(ctx)
 
     # add order id to search input with selector input[aria-label="Search all orders"] 
+    try:
+        await page.wait_for_selector('input[aria-label="Search all orders"]', timeout=5000)
+    except Exception:
+        logger.warning(f"Order search input did not appear within 5s on {page.url}")
     search_input = await page.query_selector('input[aria-label="Search all orders"]')
     if search_input:
         await search_input.fill(order_id)
@@ -578,7 +533,10 @@ async def cancel_order(ctx: BrowserContext, **args):
         return
     
     # Wait for the order list to load
-    await asyncio.sleep(3)
+    try:
+        await page.wait_for_selector('p.hzsearch-results-summary', timeout=5000)
+    except Exception:
+        logger.info(f"Order search results summary did not appear within 5s for order_id: {order_id}")
 
     # check for selector p.hzsearch-results-summary exists, if not found, it means no orders found
     orders_found = await page.query_selector('p.hzsearch-results-summary') 
@@ -599,12 +557,7 @@ async def cancel_order(ctx: BrowserContext, **args):
         yield json.dumps({"error": f"Order with ID {order_id} not found."})
         return
 
-    # Wait for the order details page to load
-    await asyncio.sleep(3)
-
-   
-
-    # Wait for the cancel button to appear
+    # Wait for the cancel button to appear (also covers the details page load)
     await page.wait_for_selector('a.a-button-text:has-text("Cancel items")', state='visible')
     # If the cancel button is not found, it means the order cannot be canceled
     if not await page.query_selector('a.a-button-text:has-text("Cancel items")'):
@@ -616,7 +569,11 @@ async def cancel_order(ctx: BrowserContext, **args):
     cancel_button = await page.query_selector('a.a-button-text:has-text("Cancel items")')
     if cancel_button:
         await cancel_button.click()
-        await page.wait_for_timeout(2000)  # Wait for the cancel confirmation dialog to appear
+        # Wait for the cancel confirmation dialog to appear
+        try:
+            await page.wait_for_selector('input[name^="cq.cancelItem"]', timeout=5000)
+        except Exception:
+            logger.warning(f"Cancel items dialog did not appear within 5s for order {order_id}")
     else:
         yield f"Cancel button not found for order {order_id}."
         return
@@ -674,8 +631,8 @@ async def adjust_cart(ctx: BrowserContext, **args):
         yield json.dumps({"error": "Both 'selector' are required."})
         return
 
-    if normalize_url(page.url) != normalize_url(f"{AMAZON_URL}/cart"):
-        await page.goto(f"{AMAZON_URL}/cart")
+    if normalize_url(page.url) != _CART_URL_NORMALIZED:
+        await page.goto(_CART_URL)
     
     try:
         await page.wait_for_load_state('domcontentloaded')
@@ -1,6 +1,6 @@
-import asyncio
 import base64
 import datetime
+import functools
 import json
 import logging
 import os
@@ -29,9 +29,8 @@ class IncrementID(object):
         self._it += 1
         return self._it
 
+@functools.lru_cache(maxsize=1)
 def get_system_prompt(file_name: str = 'system_prompt.txt') -> str:
-    import os
-
     if os.path.exists(file_name):
         with open(file_name, 'r') as fp:
             return fp.read()
@@ -84,12 +83,12 @@ async def refine_chat_history(messages: list[dict[str, str]], system_prompt: str
             and isinstance(message.get('content'), list):
 
             content = message['content']
-            text_input = ''
+            text_parts = []
             attachments = []
 
             for item in content:
                 if item.get('type', 'undefined') == 'text':
-                    text_input += item.get('text') or ''
+                    text_parts.append(item.get('text') or '')
 
                 elif item.get('type', 'undefined') == 'file':
                     file_item = item.get('file', {})
@@ -103,14 +102,12 @@ async def refine_chat_history(messages: list[dict[str, str]], system_prompt: str
                             attachments.append(file_path)
 
             if attachments:
-                text_input += '\nAttachments:\n'
-
-                for attachment in attachments:
-                    text_input += f'- {attachment}\n'
+                text_parts.append('\nAttachments:\n')
+                text_parts.extend(f'- {attachment}\n' for attachment in attachments)
 
             refined_messages.append({
                 "role": "user",
-                "content": text_input
+                "content": ''.join(text_parts)
             })
 
         else:
@@ -160,8 +157,9 @@ async def wrap_chunk(uuid: str, raw: str, role="assistant") -> ChatCompletionStr
         ]
     )
 
-async def to_chunk_data(chunk: ChatCompletionStreamResponse) -> bytes:
-    return ("data: " + json.dumps(chunk.model_dump()) + "\n\n").encode()
+def to_chunk_data(chunk: ChatCompletionStreamResponse) -> bytes:
+    # serialize in pydantic's core instead of model_dump() -> json.dumps()
+    return f"data: {chunk.model_dump_json()}\n\n".encode()
 
 async def check_authentication_required_email_or_username(ctx: BrowserContext):
     page = await ctx.get_current_page()
@@ -204,13 +202,14 @@ async def check_authentication_by_pass_captcha(ctx: BrowserContext):
   
 async def review_checkout_card_empty_delivery(ctx: BrowserContext):
     page = await ctx.get_current_page()
-    await asyncio.sleep(2)
     logger.info(f"Review checkout card empty delivery: {page.url}")
     # check if place order button is present and not disabled
-    
-    # try catch time out, continue if timeout
 
-    # await page.wait_for_selector('#placeOrder', timeout=10000)
+    # try catch time out, continue if timeout
+    try:
+        await page.wait_for_selector('#placeOrder', timeout=5000)
+    except Exception:
+        logger.warning(f"Place order button did not appear within 5s on {page.url}")
 
     place_order_button = await page.query_selector('#placeOrder')
 
@@ -428,6 +427,7 @@ def ensure_page_url(link: str):
         return wrapper
     return decorator
 
+@functools.lru_cache(maxsize=256)
 def normalize_url(url):
     parsed = urlparse(url)
     # Only keep scheme, netloc, and path (ignore query and fragment)
@@ -14,7 +14,7 @@ from app.models.oai_compatible_models import (
     ChatCompletionStreamResponse, 
     PromptErrorResponse
 )
-from app import prompt
+from app import prompt, close_llm
 from typing import AsyncGenerator
 import time
 import uuid
@@ -25,6 +25,11 @@ import xml.etree.ElementTree as ET
 from app.config import AMAZON_URL
 from app.utils import is_showing_captcha
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 BROWSER_PROFILE_DIR = "/storage/browser-profiles"
 
 logger = logging.getLogger(__name__)
@@ -237,6 +242,7 @@ async def lifespan(app: fastapi.FastAPI):
             except Exception as err:
                 logger.error(f"Exception raised while closing browser context: {err}", stack_info=True)
 
+        await close_llm()
         app_signal.set()
 
         # Cleanup any remaining Chromium processes
@@ -378,7 +384,9 @@ def main():
         allow_headers=["*"],
     )
 
-    event_loop = asyncio.new_event_loop()
+    # uvloop is pinned in requirements.base.txt; playwright and httpx run on it
+    # unchanged
+    event_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
     asyncio.set_event_loop(event_loop)
 
     config = uvicorn.Config(
@@ -14,6 +14,7 @@ import os
 from typing import Optional, Any, AsyncGenerator
 from app.configs import settings
 import json
+import orjson
 import time
 import logging
 
@@ -138,7 +139,7 @@ async def handle_request(request: ChatCompletionRequest) -> AsyncGenerator[ChatC
 
         for call in (completion.choices[0].message.tool_calls or []):
             _id, _name, _args = call.id, call.function.name, call.function.arguments
-            _args = json.loads(_args)
+            _args = orjson.loads(_args)
 
             logger.info(f"Executing tool call: {_name} with args: {_args}")
             _result = await execute_openai_compatible_toolcall(_name, _args, compose_mcp)
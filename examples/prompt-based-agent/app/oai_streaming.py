@@ -108,71 +108,94 @@ class ChatCompletionResponseBuilder:
             )
         )
 
+# One pooled client for every completion so DNS/TCP/TLS setup is paid once
+# per connection rather than once per LLM call; created lazily on first use.
+_http_client: httpx.AsyncClient | None = None
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+
+    return _http_client
+
+async def close_http_client() -> None:
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 async def create_streaming_response(
     base_url: str,
     api_key: str,
     **payload_to_call
 ) -> AsyncGenerator[ChatCompletionStreamResponse, None]:
 
-    async with httpx.AsyncClient() as client:
-        async with client.stream(
-            "POST",
-            f"{base_url}/chat/completions",
-            json={
-                **payload_to_call,
-                'stream': True
-            },
-            headers={
-                'Authorization': f'Bearer {api_key}'
-            },
-            timeout=httpx.Timeout(60.0 * 10)
-        ) as response:
-
-            try:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    while line.startswith('data: '):    
-                        line = line[6:].strip()
-
-                    if line == "": 
-                        continue
-                    
-                    # check if the line is ping 
-                    if line.startswith(": ping"):
-                        continue
+    client = get_http_client()
+
+    async with client.stream(
+        "POST",
+        f"{base_url}/chat/completions",
+        json={
+            **payload_to_call,
+            'stream': True
+        },
+        headers={
+            'Authorization': f'Bearer {api_key}'
+        },
+        timeout=httpx.Timeout(60.0 * 10)
+    ) as response:
+
+        try:
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                while line.startswith('data: '):    
+                    line = line[6:].strip()
+
+                if line == "": 
+                    continue
+                
+                # check if the line is ping 
+                if line.startswith(": ping"):
+                    continue
 
-                    if line == "[DONE]": 
-                        break
+                if line == "[DONE]": 
+                    break
 
-                    try:
-                        resp_json = json.loads(line)
+                try:
+                    resp_json = json.loads(line)
 
-                        if "error" in resp_json:
-                            yield ErrorResponse.model_validate(resp_json.get("error", {}))
+                    if "error" in resp_json:
+                        yield ErrorResponse.model_validate(resp_json.get("error", {}))
 
-                    except Exception as e:
+                except Exception as e:
 
-                        curl_command = reconstruct_curl_request(
-                            base_url,
-                            api_key,
-                            **payload_to_call,
-                            stream=True
-                        )
+                    curl_command = reconstruct_curl_request(
+                        base_url,
+                        api_key,
+                        **payload_to_call,
+                        stream=True
+                    )
 
-                        message = (
-                            f"<h2>STREAMING-ERROR</h2>\n"
-                            f"<p>Failed to parse chunk: {e}</p>\n"
-                            f"<p>line: {line}</p>\n"
-                            f"<pre>{curl_command}</pre>\n"
-                        )
+                    message = (
+                        f"<h2>STREAMING-ERROR</h2>\n"
+                        f"<p>Failed to parse chunk: {e}</p>\n"
+                        f"<p>line: {line}</p>\n"
+                        f"<pre>{curl_command}</pre>\n"
+                    )
 
-                        logger.error(message)
-                        raise e
+                    logger.error(message)
+                    raise e
 
-                    if resp_json.get('object', '') == 'chat.completion.chunk':
-                        yield ChatCompletionStreamResponse.model_validate(resp_json)
+                if resp_json.get('object', '') == 'chat.completion.chunk':
+                    yield ChatCompletionStreamResponse.model_validate(resp_json)
 
-            except Exception as e:
-                logger.error(f"Failed to stream response: {e}")
-                raise e
\ No newline at end of file
+        except Exception as e:
+            logger.error(f"Failed to stream response: {e}")
+            raise e
\ No newline at end of file
@@ -6,14 +6,17 @@ import subprocess
 from typing import Literal
 import asyncio
 import logging
-from bs4 import BeautifulSoup
 import re
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Browser, Playwright, Route
 import resource
 import os
+import time
+from urllib.parse import urlsplit, urlunsplit
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+
 class AdvanceSearchResult(SearchResult):
     def __init__(self, SearchResult: SearchResult, score: float):
         super().__init__(SearchResult.url, SearchResult.title, SearchResult.description)
@@ -26,10 +29,156 @@ python_toolkit = FastMCP(name="Python-Toolkit")
 web_toolkit = FastMCP(name="Web-Toolkit")
 bio_toolkit = FastMCP(name="Bio-Toolkit")
 
+# Exact-match result caches for the web tools: (expires_at, value) keyed by
+# the normalized request. Searches go stale faster than page contents.
+SEARCH_CACHE_TTL = 60 * 60
+SCRAPE_CACHE_TTL = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 256
+
+# Upper bound on the characters of page text returned by a single scrape
+SCRAPE_MAX_CHARS = 200_000
+
+# Upper bound on the browser contexts scrape_many opens at once; the model
+# picks `concurrency` and every slot is a context on the one shared browser
+SCRAPE_MAX_CONCURRENCY = 8
+
+_search_cache: dict[tuple[str, str], tuple[float, list]] = {}
+_scrape_cache: dict[str, tuple[float, str]] = {}
+_search_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+def _cache_get(cache: dict, key):
+    entry = cache.get(key)
+
+    if entry is None:
+        return None
+
+    if entry[0] < time.monotonic():
+        cache.pop(key, None)
+        return None
+
+    return entry[1]
+
+def _cache_put(cache: dict, key, value, ttl: float) -> None:
+    if len(cache) >= CACHE_MAX_ENTRIES:
+        # dicts keep insertion order, so this evicts the oldest entry
+        cache.pop(next(iter(cache)))
+
+    cache[key] = (time.monotonic() + ttl, value)
+
+def normalize_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+# One Chromium process is shared by every scrape; each call only pays for a
+# fresh browser context instead of a full browser launch.
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+_browser_lock = asyncio.Lock()
+
+async def _get_browser() -> Browser:
+    global _playwright, _browser
+
+    async with _browser_lock:
+        if _browser is not None and _browser.is_connected():
+            return _browser
+
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+
+        _browser = await _playwright.chromium.launch(
+            headless=True,
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--disable-dev-shm-usage',
+                '--no-sandbox',
+                '--disable-setuid-sandbox',
+                '--disable-web-security',
+                '--disable-features=VizDisplayCompositor',
+                '--mute-audio',
+                '--disable-notifications',
+                '--disable-background-networking',
+                '--disable-sync',
+                '--disable-default-apps',
+                '--disable-translate',
+                '--disable-background-timer-throttling',
+                '--disable-renderer-backgrounding'
+            ]
+        )
+
+        return _browser
+
+async def close_browser() -> None:
+    global _playwright, _browser
+
+    async with _browser_lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
 def limit_resource(memory_limit: int, cpu_limit: int):
     resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit))
     resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
 
+# Executed code is appended to code.txt by a single background writer, so the
+# interpreter tool never opens the file itself.
+_code_log_queue: asyncio.Queue | None = None
+_code_log_task: asyncio.Task | None = None
+
+async def _code_logger(queue: asyncio.Queue) -> None:
+    with open("code.txt", "a", buffering=1 << 16) as f:
+        while True:
+            chunk = await queue.get()
+
+            if chunk is None:
+                break
+
+            f.write(chunk)
+
+            if queue.empty():
+                f.flush()
+
+def _log_code(code: str) -> None:
+    global _code_log_queue, _code_log_task
+
+    if _code_log_task is None or _code_log_task.done():
+        _code_log_queue = asyncio.Queue()
+        _code_log_task = asyncio.create_task(_code_logger(_code_log_queue))
+
+    _code_log_queue.put_nowait(code + '\n')
+
+async def close_code_log() -> None:
+    if _code_log_task is not None and not _code_log_task.done():
+        _code_log_queue.put_nowait(None)
+        await _code_log_task
+
+def _names_in(target: ast.Tuple | ast.List) -> list[str]:
+    return [e.id for e in target.elts if isinstance(e, ast.Name)]
+
+class _VarCollector(ast.NodeVisitor):
+    # maps the type of an assignment's first target to the names it declares
+    _DISPATCH = {
+        ast.Name: lambda t: [t.id],
+        ast.Attribute: lambda t: [t.attr],
+        ast.Subscript: lambda t: [t.value.id] if isinstance(t.value, ast.Name) else [],
+        ast.Tuple: _names_in,
+        ast.List: _names_in,
+    }
+
+    def __init__(self):
+        self.vars: list[str] = []
+
+    def visit_Assign(self, node: ast.Assign):
+        handler = self._DISPATCH.get(type(node.targets[0]))
+
+        if handler is not None:
+            self.vars.extend(handler(node.targets[0]))
+
+        self.generic_visit(node)
+
 @python_toolkit.tool(
     name="run",
     description="Run Python code. Return the result of the code and all declared variables. Use this toolcall for complex tasks like math solving, data analysis, etc.",
@@ -38,47 +187,39 @@ def limit_resource(memory_limit: int, cpu_limit: int):
     }
 )
 async def python_interpreter(code: str) -> str:
-    variables = []
-    with open("code.txt", "a") as f:
-        f.write(code + '\n')
-
-    tree = ast.parse(code)
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Assign):
-            first_target = node.targets[0]
-            if isinstance(first_target, ast.Name):
-                variables.append(first_target.id)
-                
-            if isinstance(first_target, ast.Attribute):
-                variables.append(first_target.attr)
-            
-            if isinstance(first_target, ast.Subscript):
-                variables.append(first_target.value.id)
-
-            if isinstance(first_target, ast.Tuple):
-                for target in first_target.elts:
-                    if isinstance(target, ast.Name):
-                        variables.append(target.id)
-                        
-            if isinstance(first_target, ast.List):
-                for target in first_target.elts:
-                    if isinstance(target, ast.Name):
-                        variables.append(target.id)
+    _log_code(code)
+
+    collector = _VarCollector()
+    collector.visit(ast.parse(code))
+    variables = collector.vars
 
     for var in variables:
         code += f'\nprint("{var} = ", {var})'
 
     current_interpreter = sys.executable
+    cmd = [current_interpreter, "-"]
 
-    result = await asyncio.to_thread(
-        subprocess.check_output, 
-        [current_interpreter, "-c", code],
+    # the code is fed through stdin, so it is not bounded by ARG_MAX and no
+    # worker thread is parked while the child runs
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
         preexec_fn=lambda: limit_resource(100 * 1024 * 1024, 10),
-        timeout=30
     )
 
-    return result.decode("utf-8")
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(code.encode("utf-8")), timeout=30)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, 30)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+
+    return stdout.decode("utf-8")
 
 @web_toolkit.tool(
     name="search",
@@ -89,44 +230,72 @@ async def python_interpreter(code: str) -> str:
     }
 )
 async def search_web(query: str, lang: str = "en") -> list[AdvanceSearchResult | SearchResult]:
-    results = list(search(
-        query, 
-        sleep_interval=5, 
-        advanced=True, 
-        lang=lang, 
-        num_results=10,
-    ))
-    
-    return results
+    key = (" ".join(query.lower().split()), lang)
+    cached = _cache_get(_search_cache, key)
 
+    if cached is not None:
+        return cached
+
+    # concurrent identical searches wait for the first one instead of each
+    # paying for the rate-limited request
+    lock = _search_locks.setdefault(key, asyncio.Lock())
+
+    async with lock:
+        cached = _cache_get(_search_cache, key)
+
+        if cached is not None:
+            return cached
+
+        try:
+            # googlesearch sleeps between requests; keep that off the event loop
+            results = await asyncio.to_thread(lambda: list(search(
+                query, 
+                sleep_interval=5, 
+                advanced=True, 
+                lang=lang, 
+                num_results=10,
+            )))
+
+        finally:
+            # a newer caller may have registered its own lock under this key
+            if _search_locks.get(key) is lock:
+                del _search_locks[key]
+
+        # an empty result is usually rate limiting; let the next call retry
+        if results:
+            _cache_put(_search_cache, key, results, SEARCH_CACHE_TTL)
+
+        return results
+
+
+# Stylesheets are still loaded: innerText depends on them to hide invisible text
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+async def _block_heavy_resources(route: Route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def _scrape_url(url: str) -> str:
+    key = normalize_url(url)
+    cached = _cache_get(_scrape_cache, key)
+
+    if cached is not None:
+        return cached
+
+    browser = await _get_browser()
+
+    # Create context with realistic user agent and settings
+    context = await browser.new_context(
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        viewport={'width': 1920, 'height': 1080}
+    )
+
+    try:
+        # only rendered text is read back, so skip downloading heavy assets
+        await context.route("**/*", _block_heavy_resources)
 
-@web_toolkit.tool(
-    name="scrape",
-    description="Scrape a URL. Return the content of the page.",
-    annotations={
-        "url": "The URL to scrape",
-    }
-)
-async def scrape(url: str) -> str:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor'
-            ]
-        )
-        
-        # Create context with realistic user agent and settings
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        
         page = await context.new_page()
         
         # Additional stealth measures
@@ -140,42 +309,156 @@ async def scrape(url: str) -> str:
         await page.goto(url, timeout=60000, wait_until="networkidle")
         await page.wait_for_timeout(1000)
         
-        content = await page.locator("body").inner_html()
-        await browser.close()
+        # the browser already knows which text is rendered, so only that text
+        # (capped) crosses the CDP boundary instead of the full body HTML
+        text = await page.evaluate(
+            "(limit) => (document.body ? document.body.innerText || '' : '').slice(0, limit)",
+            SCRAPE_MAX_CHARS
+        )
 
-        html = BeautifulSoup(content, 'html.parser')
-        
-        # remove style, script
-        for style in html.find_all('style'):
-            style.decompose()
+    finally:
+        await context.close()
 
-        for script in html.find_all('script'):
-            script.decompose()
+    # remove duplicate spaces
+    text = _WS_RE.sub(' ', text)
 
-        text = html.get_text(separator=" ")
-        
-        # remove duplicate spaces
-        text = re.sub(r'\s+', ' ', text)
+    # remove leading and trailing spaces
+    text = text.strip()
+
+    # empty text usually means a bot wall or a failed render; don't pin it
+    if text:
+        _cache_put(_scrape_cache, key, text, SCRAPE_CACHE_TTL)
+
+    return text
+
+@web_toolkit.tool(
+    name="scrape",
+    description="Scrape a URL. Return the content of the page.",
+    annotations={
+        "url": "The URL to scrape",
+    }
+)
+async def scrape(url: str) -> str:
+    return await _scrape_url(url)
+
+@web_toolkit.tool(
+    name="scrape_many",
+    description="Scrape several URLs concurrently. Return the content of each page, in the same order as the URLs.",
+    annotations={
+        "urls": "The URLs to scrape",
+        "concurrency": "Maximum number of pages to load at the same time",
+    }
+)
+async def scrape_many(urls: list[str], concurrency: int = 8) -> list[str]:
+    sem = asyncio.Semaphore(min(max(1, concurrency), SCRAPE_MAX_CONCURRENCY))
 
-        # remove leading and trailing spaces
-        text = text.strip()
+    async def _one(url: str) -> str:
+        async with sem:
+            try:
+                return await _scrape_url(url)
+            except Exception as e:
+                logger.error(f"Failed to scrape {url}: {e}")
+                return f"Failed to scrape {url}: {e}"
 
-        return text
+    return await asyncio.gather(*[_one(url) for url in urls])
 
 import os
-import json
+import orjson
+import aiofiles
+
+# bio.json holds the original snapshot; every later write is appended as one
+# JSON line to bio.jsonl, so a write costs one small append instead of
+# rewriting the whole file. Both are replayed once into memory.
+BIO_FILE = "bio.json"
+BIO_LOG_FILE = "bio.jsonl"
+
+_bio_cache: dict | None = None
+_bio_lock = asyncio.Lock()
+
+async def load_bio() -> dict:
+    global _bio_cache
+
+    if _bio_cache is not None:
+        return _bio_cache
+
+    async with _bio_lock:
+        if _bio_cache is None:
+            content = []
+
+            if os.path.exists(BIO_FILE):
+                async with aiofiles.open(BIO_FILE, "rb") as f:
+                    content.extend(orjson.loads(await f.read()).get('content', []))
+
+            if os.path.exists(BIO_LOG_FILE):
+                async with aiofiles.open(BIO_LOG_FILE, "rb") as f:
+                    async for line in f:
+                        if line.strip():
+                            content.append(orjson.loads(line))
+
+            _bio_cache = {'content': content}
+
+    return _bio_cache
+
+# Writes are buffered and flushed together once no new write has arrived for
+# BIO_FLUSH_DELAY seconds, so bursts of bio updates cost a single append.
+BIO_FLUSH_DELAY = 0.25
+
+_bio_pending: list[bytes] = []
+_bio_flush_handle: asyncio.TimerHandle | None = None
+_bio_flush_lock = asyncio.Lock()
+_bio_flush_tasks: set[asyncio.Task] = set()
+
+async def flush_bio() -> None:
+    async with _bio_flush_lock:
+        if not _bio_pending:
+            return
+
+        # lines are only dropped once they are on disk; a failed append leaves
+        # them queued for the next flush
+        count = len(_bio_pending)
+        chunk = b''.join(_bio_pending)
+
+        async with aiofiles.open(BIO_LOG_FILE, "ab") as f:
+            await f.write(chunk)
+
+        del _bio_pending[:count]
+
+def _on_bio_flush_done(task: asyncio.Task) -> None:
+    _bio_flush_tasks.discard(task)
+
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Failed to flush bio to {BIO_LOG_FILE}: {task.exception()}")
+
+def _start_bio_flush() -> None:
+    task = asyncio.ensure_future(flush_bio())
+    _bio_flush_tasks.add(task)
+    task.add_done_callback(_on_bio_flush_done)
+
+def _schedule_bio_flush() -> None:
+    global _bio_flush_handle
+
+    if _bio_flush_handle is not None:
+        _bio_flush_handle.cancel()
+
+    _bio_flush_handle = asyncio.get_running_loop().call_later(
+        BIO_FLUSH_DELAY, _start_bio_flush
+    )
+
+async def close_bio() -> None:
+    global _bio_flush_handle
+
+    if _bio_flush_handle is not None:
+        _bio_flush_handle.cancel()
+        _bio_flush_handle = None
+
+    if _bio_flush_tasks:
+        await asyncio.gather(*_bio_flush_tasks, return_exceptions=True)
 
-def load_bio() -> dict:
-    if not os.path.exists("bio.json"):
-        with open("bio.json", "w") as f:
-            json.dump({'content': []}, f)
+    await flush_bio()
 
-    with open("bio.json", "r") as f:
-        return json.load(f)
-    
-def save_bio(bio_data: dict) -> None:
-    with open("bio.json", "w") as f:
-        json.dump(bio_data, f)
+def append_bio(content: str) -> None:
+    _bio_pending.append(orjson.dumps(content) + b'\n')
+    _schedule_bio_flush()
 
 @bio_toolkit.tool(
     name="action",
@@ -186,19 +469,19 @@ def save_bio(bio_data: dict) -> None:
     }
 )
 async def bio(action: Literal["write", "delete"], content: str) -> bool:
-    bio_data = await asyncio.to_thread(load_bio)
+    bio_data = await load_bio()
     success = False
  
     if action == "write":
         bio_data['content'].append(content)
+        append_bio(content)
         success = True
         
     # delete will be implemented later
-    await asyncio.to_thread(save_bio, bio_data)
     return success
 
 async def get_bio(query: str) -> list[str]:
-    bio_data = load_bio()
+    bio_data = await load_bio()
     return bio_data['content']
 
 compose = FastMCP(name="Compose")
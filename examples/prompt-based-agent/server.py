@@ -4,14 +4,22 @@ import uvicorn
 import asyncio
 from app.configs import settings
 from app.apis import api_router
+from app.tools import close_browser, close_code_log, load_bio, close_bio
+from app.oai_streaming import close_http_client
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logging_fmt = "%(asctime)s - %(message)s"
 logging.basicConfig(level=logging.INFO, format=logging_fmt)
 logger = logging.getLogger(__name__)
 
 async def lifespan(app: fastapi.FastAPI):
     logger.info(f"Starting Launchpad Agent server at {settings.host}:{settings.port}")
+    await load_bio()
 
     try:
         yield
@@ -22,6 +30,10 @@ async def lifespan(app: fastapi.FastAPI):
 
     finally:
         logger.info("Shutting down server")
+        await close_browser()
+        await close_code_log()
+        await close_bio()
+        await close_http_client()
 
 def main():
 
@@ -43,17 +55,21 @@ def main():
     async def healthcheck():
         return {"status": "ok", "message": "Yo, I am still alive"}
 
-    event_loop = asyncio.new_event_loop()
+    # uvloop ships with uvicorn[standard] (pulled in by fastapi[standard]) on
+    # every platform except Windows
+    event_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
     asyncio.set_event_loop(event_loop)
 
+    # the server runs in-process on the loop above, so uvicorn's own `loop`
+    # and `workers` settings would not apply here
     config = uvicorn.Config(
         server_app,
-        loop=event_loop,
         host=settings.host,
         port=settings.port,
         log_level="warning",
         timeout_keep_alive=300,
-        workers=32
+        http="httptools",
+        ws="none",
     )
 
     server = uvicorn.Server(config)
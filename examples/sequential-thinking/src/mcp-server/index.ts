@@ -10,6 +10,10 @@ import {
 // Fixed chalk import for ESM
 import chalk from "chalk";
 
+// Read once at startup; the flag never changes for the lifetime of the process
+const DISABLE_THOUGHT_LOGGING =
+  (process.env.DISABLE_THOUGHT_LOGGING || "").toLowerCase() === "true";
+
 interface ThoughtData {
   thought: string;
   thoughtNumber: number;
@@ -22,15 +26,17 @@ interface ThoughtData {
   nextThoughtNeeded: boolean;
 }
 
-class SequentialThinkingServer {
-  private thoughtHistory: ThoughtData[] = [];
-  private branches: Record<string, ThoughtData[]> = {};
-  private disableThoughtLogging: boolean;
+type ToolResponse = {
+  content: Array<{ type: string; text: string }>;
+  isError?: boolean;
+};
 
-  constructor() {
-    this.disableThoughtLogging =
-      (process.env.DISABLE_THOUGHT_LOGGING || "").toLowerCase() === "true";
-  }
+class SequentialThinkingServer {
+  private readonly thoughtHistory: ThoughtData[] = [];
+  private readonly branches: Record<string, ThoughtData[]> = {};
+  private readonly disableThoughtLogging: boolean = DISABLE_THOUGHT_LOGGING;
+  // Serialized Object.keys(branches); only rebuilt when a new branch appears
+  private branchesJson = "[]";
 
   private validateThoughtData(input: unknown): ThoughtData {
     const data = input as Record<string, unknown>;
@@ -97,70 +103,163 @@ class SequentialThinkingServer {
 └${border}┘`;
   }
 
-  public processThought(input: unknown): {
-    content: Array<{ type: string; text: string }>;
-    isError?: boolean;
-  } {
-    try {
-      const validatedInput = this.validateThoughtData(input);
+  private recordThought(validatedInput: ThoughtData): void {
+    const { thoughtHistory, branches, disableThoughtLogging } = this;
 
-      if (validatedInput.thoughtNumber > validatedInput.totalThoughts) {
-        validatedInput.totalThoughts = validatedInput.thoughtNumber;
-      }
+    if (validatedInput.thoughtNumber > validatedInput.totalThoughts) {
+      validatedInput.totalThoughts = validatedInput.thoughtNumber;
+    }
 
-      this.thoughtHistory.push(validatedInput);
+    thoughtHistory.push(validatedInput);
 
-      if (validatedInput.branchFromThought && validatedInput.branchId) {
-        if (!this.branches[validatedInput.branchId]) {
-          this.branches[validatedInput.branchId] = [];
-        }
-        this.branches[validatedInput.branchId].push(validatedInput);
+    const { branchFromThought, branchId } = validatedInput;
+    if (branchFromThought && branchId) {
+      let branch = branches[branchId];
+      if (!branch) {
+        branch = branches[branchId] = [];
+        this.branchesJson = JSON.stringify(Object.keys(branches));
       }
+      branch.push(validatedInput);
+    }
 
-      if (!this.disableThoughtLogging) {
-        const formattedThought = this.formatThought(validatedInput);
-        console.error(formattedThought);
-      }
+    if (!disableThoughtLogging) {
+      const formattedThought = this.formatThought(validatedInput);
+      console.error(formattedThought);
+    }
+  }
+
+  // The success payload has a fixed shape, so it is emitted directly instead
+  // of going through the generic JSON encoder on every call.
+  private summarizeThought(validatedInput: ThoughtData): string {
+    return (
+      `{"thoughtNumber":${validatedInput.thoughtNumber},` +
+      `"totalThoughts":${validatedInput.totalThoughts},` +
+      `"nextThoughtNeeded":${validatedInput.nextThoughtNeeded},` +
+      `"branches":${this.branchesJson},` +
+      `"thoughtHistoryLength":${this.thoughtHistory.length}}`
+    );
+  }
+
+  private errorResponse(error: unknown): ToolResponse {
+    return {
+      content: [
+        {
+          type: "text",
+          text: JSON.stringify(
+            {
+              error: error instanceof Error ? error.message : String(error),
+              status: "failed",
+            },
+            null,
+            2
+          ),
+        },
+      ],
+      isError: true,
+    };
+  }
+
+  public processThought(input: unknown): ToolResponse {
+    try {
+      const validatedInput = this.validateThoughtData(input);
+      this.recordThought(validatedInput);
 
       return {
         content: [
           {
             type: "text",
-            text: JSON.stringify(
-              {
-                thoughtNumber: validatedInput.thoughtNumber,
-                totalThoughts: validatedInput.totalThoughts,
-                nextThoughtNeeded: validatedInput.nextThoughtNeeded,
-                branches: Object.keys(this.branches),
-                thoughtHistoryLength: this.thoughtHistory.length,
-              },
-              null,
-              2
-            ),
+            text: this.summarizeThought(validatedInput),
           },
         ],
       };
     } catch (error) {
+      return this.errorResponse(error);
+    }
+  }
+
+  // Batched variant for scripted/replayed sessions: every input is validated
+  // before any state is touched, so an invalid entry leaves the history as-is.
+  public processThoughts(inputs: unknown): ToolResponse {
+    try {
+      if (!Array.isArray(inputs)) {
+        throw new Error("Invalid thoughts: must be an array");
+      }
+      const validatedInputs = inputs.map((input) =>
+        this.validateThoughtData(input)
+      );
+
+      const summaries: string[] = [];
+      for (const validatedInput of validatedInputs) {
+        this.recordThought(validatedInput);
+        summaries.push(this.summarizeThought(validatedInput));
+      }
+
       return {
         content: [
           {
             type: "text",
-            text: JSON.stringify(
-              {
-                error: error instanceof Error ? error.message : String(error),
-                status: "failed",
-              },
-              null,
-              2
-            ),
+            text: `[${summaries.join(",")}]`,
           },
         ],
-        isError: true,
       };
+    } catch (error) {
+      return this.errorResponse(error);
     }
   }
 }
 
+const THOUGHT_SCHEMA: Tool["inputSchema"] = {
+  type: "object",
+  properties: {
+    thought: {
+      type: "string",
+      description: "Your current thinking step",
+    },
+    nextThoughtNeeded: {
+      type: "boolean",
+      description: "Whether another thought step is needed",
+    },
+    thoughtNumber: {
+      type: "integer",
+      description: "Current thought number",
+      minimum: 1,
+    },
+    totalThoughts: {
+      type: "integer",
+      description: "Estimated total thoughts needed",
+      minimum: 1,
+    },
+    isRevision: {
+      type: "boolean",
+      description: "Whether this revises previous thinking",
+    },
+    revisesThought: {
+      type: "integer",
+      description: "Which thought is being reconsidered",
+      minimum: 1,
+    },
+    branchFromThought: {
+      type: "integer",
+      description: "Branching point thought number",
+      minimum: 1,
+    },
+    branchId: {
+      type: "string",
+      description: "Branch identifier",
+    },
+    needsMoreThoughts: {
+      type: "boolean",
+      description: "If more thoughts are needed",
+    },
+  },
+  required: [
+    "thought",
+    "nextThoughtNeeded",
+    "thoughtNumber",
+    "totalThoughts",
+  ],
+};
+
 const SEQUENTIAL_THINKING_TOOL: Tool = {
   name: "sequentialthinking",
   description: `A detailed tool for dynamic and reflective problem-solving through thoughts.
@@ -217,56 +316,27 @@ You should:
 9. Repeat the process until satisfied with the solution
 10. Provide a single, ideally correct answer as the final output
 11. Only set next_thought_needed to false when truly done and a satisfactory answer is reached`,
+  inputSchema: THOUGHT_SCHEMA,
+};
+
+const SEQUENTIAL_THINKING_BATCH_TOOL: Tool = {
+  name: "sequentialthinking_batch",
+  description: `Records several sequentialthinking thoughts in one call.
+Use it to submit a prepared or replayed chain of thoughts at once instead of one call per thought.
+Each entry in thoughts takes exactly the parameters of the sequentialthinking tool.
+All entries are validated before any is recorded, so an invalid entry leaves the history unchanged.
+Returns a JSON array with one summary per thought, in order.`,
   inputSchema: {
     type: "object",
     properties: {
-      thought: {
-        type: "string",
-        description: "Your current thinking step",
-      },
-      nextThoughtNeeded: {
-        type: "boolean",
-        description: "Whether another thought step is needed",
-      },
-      thoughtNumber: {
-        type: "integer",
-        description: "Current thought number",
-        minimum: 1,
-      },
-      totalThoughts: {
-        type: "integer",
-        description: "Estimated total thoughts needed",
-        minimum: 1,
-      },
-      isRevision: {
-        type: "boolean",
-        description: "Whether this revises previous thinking",
-      },
-      revisesThought: {
-        type: "integer",
-        description: "Which thought is being reconsidered",
-        minimum: 1,
-      },
-      branchFromThought: {
-        type: "integer",
-        description: "Branching point thought number",
-        minimum: 1,
-      },
-      branchId: {
-        type: "string",
-        description: "Branch identifier",
-      },
-      needsMoreThoughts: {
-        type: "boolean",
-        description: "If more thoughts are needed",
+      thoughts: {
+        type: "array",
+        description: "Thoughts to record, in order",
+        items: THOUGHT_SCHEMA,
+        minItems: 1,
       },
     },
-    required: [
-      "thought",
-      "nextThoughtNeeded",
-      "thoughtNumber",
-      "totalThoughts",
-    ],
+    required: ["thoughts"],
   },
 };
 
@@ -285,7 +355,7 @@ const server = new Server(
 const thinkingServer = new SequentialThinkingServer();
 
 server.setRequestHandler(ListToolsRequestSchema, async () => ({
-  tools: [SEQUENTIAL_THINKING_TOOL],
+  tools: [SEQUENTIAL_THINKING_TOOL, SEQUENTIAL_THINKING_BATCH_TOOL],
 }));
 
 server.setRequestHandler(CallToolRequestSchema, async (request) => {
@@ -293,6 +363,10 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
     return thinkingServer.processThought(request.params.arguments);
   }
 
+  if (request.params.name === "sequentialthinking_batch") {
+    return thinkingServer.processThoughts(request.params.arguments?.thoughts);
+  }
+
   return {
     content: [
       {